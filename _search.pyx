@@ -0,0 +1,313 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled search core for autonom.py.
+
+The C routines mirror the Numba kernels in autonom.py: they search a
+row-major obstacle bitboard (bit r * cols + c set for a blocked cell, 64
+cells per uint64 word, as built by autonom._pack_grid) between flat cell
+indices and write the path into a caller-provided buffer, returning its
+length (0 when the goal is unreachable, -1 when memory could not be
+allocated). They run without the GIL, so separate grids can be searched
+from parallel threads.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport calloc, free, malloc
+
+ctypedef int (*search_fn)(const uint64_t*, int, int, int, int, int*) noexcept nogil
+
+# Neighbour moves: left, right, up, down (same order as autonom._MOVES)
+cdef int _DR[4]
+cdef int _DC[4]
+_DR[:] = [0, 0, -1, 1]
+_DC[:] = [-1, 1, 0, 0]
+
+cdef inline bint _bit_get(const uint64_t* bitmap, int i) noexcept nogil:
+    return (bitmap[i >> 6] >> (i & 63)) & 1
+
+cdef inline void _bit_set(uint64_t* bitmap, int i) noexcept nogil:
+    bitmap[i >> 6] |= (<uint64_t> 1) << (i & 63)
+
+cdef int _trace(const int* came_from, int goal, int* out) noexcept nogil:
+    """Walks came_from back from goal, writing the ordered path into out."""
+    cdef int length = 1
+    cdef int node = goal
+    cdef int i
+    while came_from[node] != -1:
+        node = came_from[node]
+        length += 1
+    node = goal
+    for i in range(length - 1, -1, -1):
+        out[i] = node
+        node = came_from[node]
+    return length
+
+# =================================================================
+# Breadth-First Search (BFS)
+# =================================================================
+cdef int bfs_c(const uint64_t* blocked, int rows, int cols, int s, int g,
+               int* out) noexcept nogil:
+    cdef int n = rows * cols
+    cdef int* queue = <int*> malloc(n * sizeof(int))
+    cdef int* came_from = <int*> malloc(n * sizeof(int))
+    cdef uint64_t* visited = <uint64_t*> calloc((n + 63) >> 6, sizeof(uint64_t))
+    cdef int offsets[4]
+    cdef int head = 0, tail = 1, length = 0
+    cdef int node, r, c, k, nr, nc, neighbor, i
+    if queue == NULL or came_from == NULL or visited == NULL:
+        free(queue)
+        free(came_from)
+        free(visited)
+        return -1
+
+    offsets[:] = [-1, 1, -cols, cols]
+    for i in range(n):
+        came_from[i] = -1
+    queue[0] = s
+    _bit_set(visited, s)
+    if s == g:
+        length = _trace(came_from, g, out)
+
+    while length == 0 and head < tail:
+        node = queue[head]
+        head += 1
+        r = node // cols
+        c = node % cols
+        for k in range(4):
+            nr = r + _DR[k]
+            nc = c + _DC[k]
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
+                if not _bit_get(blocked, neighbor) and not _bit_get(visited, neighbor):
+                    came_from[neighbor] = node
+                    _bit_set(visited, neighbor)
+                    if neighbor == g:
+                        length = _trace(came_from, g, out)
+                        break
+                    queue[tail] = neighbor
+                    tail += 1
+
+    free(queue)
+    free(came_from)
+    free(visited)
+    return length
+
+# =================================================================
+# Depth-First Search (DFS)
+# =================================================================
+cdef int dfs_c(const uint64_t* blocked, int rows, int cols, int s, int g,
+               int* out) noexcept nogil:
+    cdef int n = rows * cols
+    cdef int* stack = <int*> malloc(n * sizeof(int))
+    cdef int* came_from = <int*> malloc(n * sizeof(int))
+    cdef uint64_t* visited = <uint64_t*> calloc((n + 63) >> 6, sizeof(uint64_t))
+    cdef int offsets[4]
+    cdef int top = 1, length = 0
+    cdef int node, r, c, k, nr, nc, neighbor, i
+    if stack == NULL or came_from == NULL or visited == NULL:
+        free(stack)
+        free(came_from)
+        free(visited)
+        return -1
+
+    offsets[:] = [-1, 1, -cols, cols]
+    for i in range(n):
+        came_from[i] = -1
+    stack[0] = s
+    _bit_set(visited, s)
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if node == g:
+            length = _trace(came_from, g, out)
+            break
+
+        r = node // cols
+        c = node % cols
+        # Pushed in reverse so that left is popped (explored) first
+        for k in range(3, -1, -1):
+            nr = r + _DR[k]
+            nc = c + _DC[k]
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
+                if not _bit_get(blocked, neighbor) and not _bit_get(visited, neighbor):
+                    came_from[neighbor] = node
+                    _bit_set(visited, neighbor)
+                    stack[top] = neighbor
+                    top += 1
+
+    free(stack)
+    free(came_from)
+    free(visited)
+    return length
+
+# =================================================================
+# A* Search with Fuel Optimization
+# =================================================================
+cdef int _heap_push(int* f_heap, int* node_heap, int size, int f_score,
+                    int node) noexcept nogil:
+    """Sifts node up into place; returns the new heap size."""
+    cdef int i = size, up
+    while i > 0:
+        up = (i - 1) >> 1
+        if f_heap[up] <= f_score:
+            break
+        f_heap[i] = f_heap[up]
+        node_heap[i] = node_heap[up]
+        i = up
+    f_heap[i] = f_score
+    node_heap[i] = node
+    return size + 1
+
+cdef void _sift_down(int* f_heap, int* node_heap, int size, int f_score,
+                     int node) noexcept nogil:
+    """Overwrites the root with (f_score, node) and sifts it down into place."""
+    cdef int i = 0, child = 1
+    while child < size:
+        if child + 1 < size and f_heap[child + 1] < f_heap[child]:
+            child += 1
+        if f_heap[child] >= f_score:
+            break
+        f_heap[i] = f_heap[child]
+        node_heap[i] = node_heap[child]
+        i = child
+        child = 2 * i + 1
+    f_heap[i] = f_score
+    node_heap[i] = node
+
+cdef int _heap_pop(int* f_heap, int* node_heap, int size) noexcept nogil:
+    """Removes the root (read it from node_heap[0] first); returns the new size."""
+    size -= 1
+    if size:
+        _sift_down(f_heap, node_heap, size, f_heap[size], node_heap[size])
+    return size
+
+cdef int _heap_pushpop(int* f_heap, int* node_heap, int size, int f_score,
+                       int node) noexcept nogil:
+    """Pushes (f_score, node) and pops the lowest node; the size is unchanged."""
+    cdef int top
+    if size == 0 or f_score <= f_heap[0]:
+        return node
+    top = node_heap[0]
+    _sift_down(f_heap, node_heap, size, f_score, node)
+    return top
+
+cdef int a_star_c(const uint64_t* blocked, int rows, int cols, int s, int g,
+                  int* out) noexcept nogil:
+    cdef int n = rows * cols
+    # Each cell is expanded at most once and pushes at most 4 neighbours
+    cdef int* f_heap = <int*> malloc((4 * n + 1) * sizeof(int))
+    cdef int* node_heap = <int*> malloc((4 * n + 1) * sizeof(int))
+    cdef int* min_fuel_consumed = <int*> malloc(n * sizeof(int))
+    cdef int* came_from = <int*> malloc(n * sizeof(int))
+    cdef unsigned char* closed = <unsigned char*> calloc(n, sizeof(unsigned char))
+    cdef int offsets[4]
+    cdef int size = 0, length = 0, next_node = s
+    cdef int node, r, c, k, nr, nc, neighbor, i, tentative_fuel
+    cdef int f_score, best_f, best_node
+    cdef int goal_r = g // cols, goal_c = g % cols
+    if f_heap == NULL or node_heap == NULL or min_fuel_consumed == NULL or \
+       came_from == NULL or closed == NULL:
+        free(f_heap)
+        free(node_heap)
+        free(min_fuel_consumed)
+        free(came_from)
+        free(closed)
+        return -1
+
+    offsets[:] = [-1, 1, -cols, cols]
+    for i in range(n):
+        min_fuel_consumed[i] = 2147483647
+        came_from[i] = -1
+    min_fuel_consumed[s] = 0
+    if s == g:
+        length = _trace(came_from, g, out)
+
+    # The cheapest entry from each expansion is carried in next_node and only
+    # goes through the heap when the root beats it
+    while length == 0 and (next_node >= 0 or size > 0):
+        if next_node >= 0:
+            node = next_node
+            next_node = -1
+        else:
+            node = node_heap[0]
+            size = _heap_pop(f_heap, node_heap, size)
+        if closed[node]:
+            continue
+        closed[node] = 1
+        r = node // cols
+        c = node % cols
+        tentative_fuel = min_fuel_consumed[node] + 1
+        best_f = 2147483647
+        best_node = -1
+
+        for k in range(4):
+            nr = r + _DR[k]
+            nc = c + _DC[k]
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
+                if not _bit_get(blocked, neighbor) and tentative_fuel < min_fuel_consumed[neighbor]:
+                    min_fuel_consumed[neighbor] = tentative_fuel
+                    came_from[neighbor] = node
+                    if neighbor == g:
+                        length = _trace(came_from, g, out)
+                        break
+                    f_score = tentative_fuel + abs(nr - goal_r) + abs(nc - goal_c)
+                    if f_score < best_f:
+                        best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                    if neighbor >= 0:
+                        size = _heap_push(f_heap, node_heap, size, f_score, neighbor)
+
+        if length == 0 and best_node >= 0:
+            next_node = _heap_pushpop(f_heap, node_heap, size, best_f, best_node)
+
+    free(f_heap)
+    free(node_heap)
+    free(min_fuel_consumed)
+    free(came_from)
+    free(closed)
+    return length
+
+# =================================================================
+# Python Wrappers
+# =================================================================
+cdef object _run(search_fn search, const uint64_t[::1] blocked, int rows,
+                 int cols, int start, int goal):
+    """Runs a C search without the GIL and returns its path as a list."""
+    cdef int* out
+    cdef int length
+    cdef int i
+    # The C routines index the bitboard and their buffers unchecked
+    if rows <= 0 or cols <= 0:
+        raise ValueError("grid must have at least one cell")
+    if not (0 <= start < rows * cols and 0 <= goal < rows * cols):
+        raise ValueError("start and goal must be cell indices on the grid")
+    if blocked.shape[0] < (rows * cols + 63) >> 6:
+        raise ValueError("blocked is too short for a %d x %d grid" % (rows, cols))
+    out = <int*> malloc(rows * cols * sizeof(int))
+    if out == NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            length = search(&blocked[0], rows, cols, start, goal, out)
+        if length < 0:
+            raise MemoryError()
+        if length == 0:
+            return None
+        return [out[i] for i in range(length)]
+    finally:
+        free(out)
+
+def bfs(const uint64_t[::1] blocked, int rows, int cols, int start, int goal):
+    """BFS over an obstacle bitboard; returns a list of flat cell indices or None."""
+    return _run(bfs_c, blocked, rows, cols, start, goal)
+
+def dfs(const uint64_t[::1] blocked, int rows, int cols, int start, int goal):
+    """DFS over an obstacle bitboard; returns a list of flat cell indices or None."""
+    return _run(dfs_c, blocked, rows, cols, start, goal)
+
+def a_star_search(const uint64_t[::1] blocked, int rows, int cols, int start, int goal):
+    """A* over an obstacle bitboard; returns a list of flat cell indices or None."""
+    return _run(a_star_c, blocked, rows, cols, start, goal)
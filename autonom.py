@@ -1,5 +1,35 @@
-import heapq
-from collections import deque
+from array import array
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    # Ahead-of-time compiled search core, built by setup.py from _search.pyx
+    import _search
+    _CYTHON_AVAILABLE = True
+except ImportError:
+    _CYTHON_AVAILABLE = False
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Without Numba the pure-Python searches below are used instead.
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels still define without Numba."""
+        return lambda func: func
+
+# Neighbour moves as (d_row, d_col): left, right, up, down. The matching
+# flat-index offsets for a grid are (-1, 1, -cols, cols). The two stride-1
+# neighbours come first because on the row-major grid they usually share a
+# cache line with the current cell.
+_MOVES = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_MOVES_REV = _MOVES[::-1]
+
+# Fuel value for cells not reached yet in the dense int32 g-score arrays
+_UNREACHED = np.iinfo(np.int32).max
 
 # =================================================================
 # Heuristic Function for A* Search (Manhattan Distance)
@@ -14,36 +44,144 @@ def manhattan_distance(a, b):
     """
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
+# =================================================================
+# Grid Flattening and Path Reconstruction Helpers
+# =================================================================
+def _flatten_grid(grid):
+    """
+    Packs the grid into one contiguous row-major uint8 buffer.
+    Cell (r, c) lives at index r * cols + c.
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
+    :return: Tuple (cells, rows, cols) where cells is a bytes object.
+    """
+    flat = np.asarray(grid, dtype=np.uint8)
+    rows, cols = flat.shape
+    return flat.ravel().tobytes(), rows, cols
+
+def _pack_grid(grid):
+    """
+    Packs the grid into a bitboard of obstacles: bit r * cols + c is set when
+    cell (r, c) is blocked, 64 cells per uint64 word.
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
+    :return: Tuple (blocked, rows, cols) where blocked is a uint64 array.
+    """
+    flat = np.asarray(grid, dtype=np.uint8)
+    rows, cols = flat.shape
+    bits = np.zeros(((rows * cols + 63) >> 6) << 3, np.uint8)
+    packed = np.packbits(flat.ravel(), bitorder='little')
+    bits[:packed.size] = packed
+    # Read the bytes as little-endian words, then store them in native order
+    return bits.view('<u8').astype(np.uint64), rows, cols
+
+def _on_grid(start, goal, rows, cols):
+    """
+    Checks that start and goal both lie inside the grid. This must run before
+    they are flattened: a flat index r * cols + c does not catch an off-grid
+    column, which rolls over into the next row.
+    :return: True when both positions are on the grid.
+    """
+    return 0 <= start[0] < rows and 0 <= start[1] < cols and \
+        0 <= goal[0] < rows and 0 <= goal[1] < cols
+
+def _reconstruct_path(parent, goal, cols):
+    """
+    Rebuilds the path to goal by walking parent pointers back to the start.
+    :param parent: Dictionary mapping each flat cell index to the index it was
+                   reached from (the start index maps to None).
+    :param goal: Flat cell index of the goal position.
+    :param cols: Number of columns in the grid.
+    :return: List of (row, col) coordinates from start to goal.
+    """
+    path = []
+    node = goal
+    while node is not None:
+        path.append(divmod(node, cols))
+        node = parent[node]
+    path.reverse()
+    return path
+
 # =================================================================
 # Breadth-First Search (BFS) Implementation
 # =================================================================
 def bfs(grid, start, goal):
     """
     Finds the shortest path from start to goal in a grid using BFS.
-    :param grid: 2D list representing the map (0: path, 1: obstacle).
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
     :param start: Tuple (row, col) of the start position.
     :param goal: Tuple (row, col) of the goal position.
     :return: List of coordinates representing the path, or None.
     """
-    rows, cols = len(grid), len(grid[0])
-    queue = deque([(start, [start])])
-    visited = {start}
-    movements = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if _CYTHON_AVAILABLE:
+        return _run_compiled(_search.bfs, grid, start, goal)
+    if _NUMBA_AVAILABLE:
+        return _run_kernel(_bfs_nb, grid, start, goal)
 
-    while queue:
-        (r, c), path = queue.popleft()
-        if (r, c) == goal:
-            return path
-        
-        for dr, dc in movements:
-            nr, nc = r + dr, c + dc
-            neighbor = (nr, nc)
-            
-            if 0 <= nr < rows and 0 <= nc < cols and \
-               grid[nr][nc] == 0 and neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
+    cells, rows, cols = _flatten_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    start_idx = start[0] * cols + start[1]
+    goal_idx = goal[0] * cols + goal[1]
+    if start_idx == goal_idx:
+        return [tuple(start)]
+    # Frontier: preallocated ring buffer of cell indices (each cell is
+    # enqueued at most once, so rows * cols slots always suffice)
+    queue = array('i', [0]) * (rows * cols)
+    queue[0] = start_idx
+    head, tail = 0, 1
+    parent = {start_idx: None}
+    # Visited bitmap: one bit per cell, 8 cells per byte
+    visited = bytearray((rows * cols + 7) >> 3)
+    visited[start_idx >> 3] |= 1 << (start_idx & 7)
+
+    # The goal is checked when it is discovered rather than when it is
+    # popped, which saves expanding one whole layer
+    while head < tail:
+        node = queue[head]
+        head += 1
+        r, c = divmod(node, cols)
+        # Left
+        if c > 0:
+            neighbor = node - 1
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                if neighbor == goal_idx:
+                    return _reconstruct_path(parent, goal_idx, cols)
+                queue[tail] = neighbor
+                tail += 1
+
+        # Right
+        if c < cols - 1:
+            neighbor = node + 1
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                if neighbor == goal_idx:
+                    return _reconstruct_path(parent, goal_idx, cols)
+                queue[tail] = neighbor
+                tail += 1
+
+        # Up
+        if r > 0:
+            neighbor = node - cols
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                if neighbor == goal_idx:
+                    return _reconstruct_path(parent, goal_idx, cols)
+                queue[tail] = neighbor
+                tail += 1
+
+        # Down
+        if r < rows - 1:
+            neighbor = node + cols
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                if neighbor == goal_idx:
+                    return _reconstruct_path(parent, goal_idx, cols)
+                queue[tail] = neighbor
+                tail += 1
     
     return None
 
@@ -53,34 +191,126 @@ def bfs(grid, start, goal):
 def dfs(grid, start, goal):
     """
     Finds a path from start to goal in a grid using DFS.
-    :param grid: 2D list representing the map (0: path, 1: obstacle).
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
     :param start: Tuple (row, col) of the start position.
     :param goal: Tuple (row, col) of the goal position.
     :return: List of coordinates representing the path, or None.
     """
-    rows, cols = len(grid), len(grid[0])
-    stack = [(start, [start])]
-    visited = {start}
-    movements = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if _CYTHON_AVAILABLE:
+        return _run_compiled(_search.dfs, grid, start, goal)
+    if _NUMBA_AVAILABLE:
+        return _run_kernel(_dfs_nb, grid, start, goal)
+
+    cells, rows, cols = _flatten_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    start_idx = start[0] * cols + start[1]
+    goal_idx = goal[0] * cols + goal[1]
+    stack = [start_idx]
+    parent = {start_idx: None}
+    # Visited bitmap: one bit per cell, 8 cells per byte
+    visited = bytearray((rows * cols + 7) >> 3)
+    visited[start_idx >> 3] |= 1 << (start_idx & 7)
 
     while stack:
-        (r, c), path = stack.pop()
+        node = stack.pop()
         
-        if (r, c) == goal:
-            return path
+        if node == goal_idx:
+            return _reconstruct_path(parent, goal_idx, cols)
         
-        for dr, dc in reversed(movements):
-            nr, nc = r + dr, c + dc
-            neighbor = (nr, nc)
-            
-            if 0 <= nr < rows and 0 <= nc < cols and \
-               grid[nr][nc] == 0 and neighbor not in visited:
-                visited.add(neighbor)
-                new_path = path + [neighbor]
-                stack.append((neighbor, new_path))
+        r, c = divmod(node, cols)
+        # Pushed in reverse so that Left is popped (explored) first
+        # Down
+        if r < rows - 1:
+            neighbor = node + cols
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                stack.append(neighbor)
+
+        # Up
+        if r > 0:
+            neighbor = node - cols
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                stack.append(neighbor)
+
+        # Right
+        if c < cols - 1:
+            neighbor = node + 1
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                stack.append(neighbor)
+
+        # Left
+        if c > 0:
+            neighbor = node - 1
+            if cells[neighbor] == 0 and not visited[neighbor >> 3] & (1 << (neighbor & 7)):
+                parent[neighbor] = node
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                stack.append(neighbor)
     
     return None
 
+# =================================================================
+# Binary Heap Helpers for A* Search
+# =================================================================
+# The open list is kept as two parallel lists, f_heap and node_heap, so
+# each sift compares plain ints instead of tuples.
+
+def _heap_push(f_heap, node_heap, f_score, node):
+    """Pushes node with priority f_score, sifting it up into place."""
+    f_heap.append(f_score)
+    node_heap.append(node)
+    i = len(f_heap) - 1
+    while i > 0:
+        up = (i - 1) >> 1
+        if f_heap[up] <= f_score:
+            break
+        f_heap[i] = f_heap[up]
+        node_heap[i] = node_heap[up]
+        i = up
+    f_heap[i] = f_score
+    node_heap[i] = node
+
+def _sift_down(f_heap, node_heap, f_score, node):
+    """Overwrites the root with (f_score, node) and sifts it down into place."""
+    size = len(f_heap)
+    i = 0
+    child = 1
+    while child < size:
+        if child + 1 < size and f_heap[child + 1] < f_heap[child]:
+            child += 1
+        if f_heap[child] >= f_score:
+            break
+        f_heap[i] = f_heap[child]
+        node_heap[i] = node_heap[child]
+        i = child
+        child = 2 * i + 1
+    f_heap[i] = f_score
+    node_heap[i] = node
+
+def _heap_pop(f_heap, node_heap):
+    """Removes and returns the (f_score, node) pair with the lowest f_score."""
+    f_score, node = f_heap[0], node_heap[0]
+    last_f, last_node = f_heap.pop(), node_heap.pop()
+    if f_heap:
+        _sift_down(f_heap, node_heap, last_f, last_node)
+    return f_score, node
+
+def _heap_pushpop(f_heap, node_heap, f_score, node):
+    """
+    Pushes (f_score, node) and pops the lowest pair with at most one sift.
+    An entry no worse than the root is handed straight back untouched.
+    """
+    if not f_heap or f_score <= f_heap[0]:
+        return f_score, node
+    top = f_heap[0], node_heap[0]
+    _sift_down(f_heap, node_heap, f_score, node)
+    return top
+
 # =================================================================
 # A* Search Implementation with Fuel Optimization
 # =================================================================
@@ -89,43 +319,564 @@ def a_star_search(grid, start, goal):
     Finds the optimal path (least fuel) from start to goal using A* search.
     The cost (g_score) is the fuel consumed, with each step costing 1 unit.
     """
-    rows, cols = len(grid), len(grid[0])
+    if _CYTHON_AVAILABLE:
+        return _run_compiled(_search.a_star_search, grid, start, goal)
+    if _NUMBA_AVAILABLE:
+        return _run_kernel(_astar_nb, grid, start, goal)
+
+    cells, rows, cols = _flatten_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    start_idx = start[0] * cols + start[1]
+    goal_idx = goal[0] * cols + goal[1]
+    goal_r, goal_c = goal
+    if start_idx == goal_idx:
+        return [tuple(start)]
     
-    # Priority queue: stores (f_score, fuel_consumed, current_node, path)
-    open_list = [(manhattan_distance(start, goal), 0, start, [start])]
+    # Priority queue: parallel f_score / node heaps. The cheapest entry
+    # produced by an expansion is carried in next_node instead, and only
+    # goes through the heap (via _heap_pushpop) when the root beats it.
+    f_heap, node_heap = [], []
+    next_node = start_idx
     
-    # Dictionary to store the minimum fuel consumed to reach a node
-    min_fuel_consumed = {start: 0}
+    # Dense per-cell arrays: minimum fuel consumed to reach a node, and
+    # whether it has already been expanded
+    min_fuel_consumed = array('i', [_UNREACHED]) * (rows * cols)
+    min_fuel_consumed[start_idx] = 0
+    closed = bytearray(rows * cols)
     
-    movements = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    # Dictionary to store the node each node was best reached from
+    came_from = {start_idx: None}
 
-    while open_list:
+    while next_node >= 0 or f_heap:
         # Get the node with the lowest f_score (lowest estimated total fuel cost)
-        _, current_fuel, current_node, path = heapq.heappop(open_list)
+        if next_node >= 0:
+            current_node, next_node = next_node, -1
+        else:
+            _, current_node = _heap_pop(f_heap, node_heap)
         
-        if current_node == goal:
-            return path
+        # Skip stale entries: the node was already expanded with its best fuel
+        if closed[current_node]:
+            continue
+        closed[current_node] = 1
+        
+        r, c = divmod(current_node, cols)
+        current_fuel = min_fuel_consumed[current_node]
 
-        for dr, dc in movements:
-            neighbor = (current_node[0] + dr, current_node[1] + dc)
-            
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols and \
-               grid[neighbor[0]][neighbor[1]] == 0:
-                
-                # Each step consumes 1 unit of fuel
+        # Each step consumes 1 unit of fuel
+        tentative_fuel = current_fuel + 1
+        best_f, best_node = _UNREACHED, -1
+
+        # For each neighbor, relax it if we've found a more fuel-efficient path;
+        # f_score = fuel_consumed + estimated_remaining_fuel. The cheapest one
+        # is held back in best_node and the rest are pushed.
+        # Reaching the goal from here is already optimal: the Manhattan
+        # heuristic is consistent, so this node's f_score (fuel + 1) is a
+        # lower bound on every route still in the open list.
+
+        # Left
+        if c > 0:
+            neighbor = current_node - 1
+            if cells[neighbor] == 0 and \
+               tentative_fuel < min_fuel_consumed[neighbor]:
+                min_fuel_consumed[neighbor] = tentative_fuel
+                came_from[neighbor] = current_node
+                if neighbor == goal_idx:
+                    return _reconstruct_path(came_from, goal_idx, cols)
+                f_score = tentative_fuel + abs(r - goal_r) + abs(c - 1 - goal_c)
+                if f_score < best_f:
+                    best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                if neighbor >= 0:
+                    _heap_push(f_heap, node_heap, f_score, neighbor)
+
+        # Right
+        if c < cols - 1:
+            neighbor = current_node + 1
+            if cells[neighbor] == 0 and \
+               tentative_fuel < min_fuel_consumed[neighbor]:
+                min_fuel_consumed[neighbor] = tentative_fuel
+                came_from[neighbor] = current_node
+                if neighbor == goal_idx:
+                    return _reconstruct_path(came_from, goal_idx, cols)
+                f_score = tentative_fuel + abs(r - goal_r) + abs(c + 1 - goal_c)
+                if f_score < best_f:
+                    best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                if neighbor >= 0:
+                    _heap_push(f_heap, node_heap, f_score, neighbor)
+
+        # Up
+        if r > 0:
+            neighbor = current_node - cols
+            if cells[neighbor] == 0 and \
+               tentative_fuel < min_fuel_consumed[neighbor]:
+                min_fuel_consumed[neighbor] = tentative_fuel
+                came_from[neighbor] = current_node
+                if neighbor == goal_idx:
+                    return _reconstruct_path(came_from, goal_idx, cols)
+                f_score = tentative_fuel + abs(r - 1 - goal_r) + abs(c - goal_c)
+                if f_score < best_f:
+                    best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                if neighbor >= 0:
+                    _heap_push(f_heap, node_heap, f_score, neighbor)
+
+        # Down
+        if r < rows - 1:
+            neighbor = current_node + cols
+            if cells[neighbor] == 0 and \
+               tentative_fuel < min_fuel_consumed[neighbor]:
+                min_fuel_consumed[neighbor] = tentative_fuel
+                came_from[neighbor] = current_node
+                if neighbor == goal_idx:
+                    return _reconstruct_path(came_from, goal_idx, cols)
+                f_score = tentative_fuel + abs(r + 1 - goal_r) + abs(c - goal_c)
+                if f_score < best_f:
+                    best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                if neighbor >= 0:
+                    _heap_push(f_heap, node_heap, f_score, neighbor)
+
+        # Expand the cheapest new neighbor next unless the heap root beats it
+        if best_node >= 0:
+            _, next_node = _heap_pushpop(f_heap, node_heap, best_f, best_node)
+    
+    return None
+
+# =================================================================
+# Bidirectional A* Search for Long Routes
+# =================================================================
+# Above this start-to-goal Manhattan distance, route_auto switches from the
+# pure-Python a_star_search to bidirectional_a_star.
+BIDIRECTIONAL_THRESHOLD = 64
+
+def bidirectional_a_star(grid, start, goal):
+    """
+    Finds the optimal path (least fuel) by running A* forward from start and
+    backward from goal at the same time, always expanding the frontier with
+    the lower f_score. The best meeting point seen so far gives an upper bound
+    mu on the fuel; the search stops once either frontier's lowest f_score
+    reaches mu (Pohl's termination condition). Ties on f_score are broken
+    towards the higher fuel consumed, so each side runs along the plateau of
+    equal-f cells instead of flooding it.
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
+    :param start: Tuple (row, col) of the start position.
+    :param goal: Tuple (row, col) of the goal position.
+    :return: List of coordinates representing the path, or None.
+    """
+    cells, rows, cols = _flatten_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    start_idx = start[0] * cols + start[1]
+    goal_idx = goal[0] * cols + goal[1]
+    if start_idx == goal_idx:
+        return [tuple(start)]
+    # The backward search is seeded from the goal, so it must be free
+    if cells[goal_idx]:
+        return None
+    offsets = (-1, 1, -cols, cols)
+    # Heap keys pack f_score * scale + (scale - 1 - fuel): ordered by f_score,
+    # then by higher fuel. key // scale recovers the f_score.
+    scale = rows * cols + 1
+    start_key = manhattan_distance(start, goal) * scale + scale - 1
+
+    # Forward search state (heuristic towards goal)
+    f_heap_f, node_heap_f = [start_key], [start_idx]
+    g_f, came_from_f = array('i', [_UNREACHED]) * (rows * cols), {start_idx: None}
+    g_f[start_idx] = 0
+    closed_f = bytearray(rows * cols)
+
+    # Backward search state (heuristic towards start)
+    f_heap_b, node_heap_b = [start_key], [goal_idx]
+    g_b, came_from_b = array('i', [_UNREACHED]) * (rows * cols), {goal_idx: None}
+    g_b[goal_idx] = 0
+    closed_b = bytearray(rows * cols)
+
+    mu = _UNREACHED
+    meeting_node = None
+
+    while f_heap_f and f_heap_b:
+        if max(f_heap_f[0], f_heap_b[0]) // scale >= mu:
+            break
+
+        if f_heap_f[0] <= f_heap_b[0]:
+            f_heap, node_heap, g_this, g_other, came_from, closed = \
+                f_heap_f, node_heap_f, g_f, g_b, came_from_f, closed_f
+            target_r, target_c = goal
+        else:
+            f_heap, node_heap, g_this, g_other, came_from, closed = \
+                f_heap_b, node_heap_b, g_b, g_f, came_from_b, closed_b
+            target_r, target_c = start
+
+        _, node = _heap_pop(f_heap, node_heap)
+
+        # Skip stale entries: this side already expanded the node with its best fuel
+        if closed[node]:
+            continue
+        closed[node] = 1
+
+        r, c = divmod(node, cols)
+        tentative_fuel = g_this[node] + 1
+        for (dr, dc), offset in zip(_MOVES, offsets):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offset
+                if cells[neighbor] == 0 and \
+                   tentative_fuel < g_this[neighbor]:
+                    g_this[neighbor] = tentative_fuel
+                    came_from[neighbor] = node
+                    f_score = tentative_fuel + abs(nr - target_r) + abs(nc - target_c)
+                    _heap_push(f_heap, node_heap,
+                               f_score * scale + scale - 1 - tentative_fuel,
+                               neighbor)
+
+                    # The frontiers touch here: record the joined route if cheaper
+                    total = tentative_fuel + g_other[neighbor]
+                    if total < mu:
+                        mu = total
+                        meeting_node = neighbor
+
+    if meeting_node is None:
+        return None
+
+    # Join start -> meeting_node with meeting_node -> goal
+    path = _reconstruct_path(came_from_f, meeting_node, cols)
+    node = came_from_b[meeting_node]
+    while node is not None:
+        path.append(divmod(node, cols))
+        node = came_from_b[node]
+    return path
+
+def route_auto(grid, start, goal, threshold=BIDIRECTIONAL_THRESHOLD):
+    """
+    Picks the A* variant for a query. The compiled a_star_search is used
+    whenever a compiled core is available; otherwise long routes go to
+    bidirectional A*, which can expand fewer cells on open maps.
+    :param threshold: Manhattan distance above which bidirectional A* is used.
+    :return: List of coordinates representing the path, or None.
+    """
+    if _CYTHON_AVAILABLE or _NUMBA_AVAILABLE:
+        return a_star_search(grid, start, goal)
+    if manhattan_distance(start, goal) > threshold:
+        return bidirectional_a_star(grid, start, goal)
+    return a_star_search(grid, start, goal)
+
+# =================================================================
+# Numba JIT Search Kernels
+# =================================================================
+# The kernels mirror bfs, dfs and a_star_search over the grid packed as an
+# obstacle bitboard (see _pack_grid) using preallocated NumPy arrays, so the
+# hot loops compile to native code.
+# Each returns (path, length) where path holds flat cell indices and a
+# length of 0 means the goal is unreachable.
+# Numba does not bounds-check array accesses, so the kernels must only be
+# given on-grid start and goal indices; _run_kernel checks this first.
+
+@njit(cache=True)
+def _trace_nb(came_from, goal_idx):
+    """Walks came_from back from goal_idx into an ordered index path."""
+    length = 1
+    node = goal_idx
+    while came_from[node] != -1:
+        node = came_from[node]
+        length += 1
+    path = np.empty(length, np.int32)
+    node = goal_idx
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = came_from[node]
+    return path, length
+
+@njit(cache=True)
+def _bit_get(bitmap, i):
+    """Reads bit i of a uint64 bitmap (64 cells per word)."""
+    return (bitmap[i >> 6] >> np.uint64(i & 63)) & np.uint64(1)
+
+@njit(cache=True)
+def _bit_set(bitmap, i):
+    """Sets bit i of a uint64 bitmap."""
+    bitmap[i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+
+@njit(cache=True)
+def _bfs_nb(blocked, rows, cols, start_idx, goal_idx):
+    """Numba kernel for bfs; the frontier is a ring buffer of cell indices."""
+    n = rows * cols
+    queue = np.empty(n, np.int32)
+    visited = np.zeros((n + 63) >> 6, np.uint64)
+    came_from = np.full(n, -1, np.int32)
+    offsets = (-1, 1, -cols, cols)
+    head = 0
+    tail = 1
+    queue[0] = start_idx
+    _bit_set(visited, start_idx)
+
+    if start_idx == goal_idx:
+        return _trace_nb(came_from, goal_idx)
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        r, c = node // cols, node % cols
+        for k in range(4):
+            dr, dc = _MOVES[k]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
+                if not _bit_get(blocked, neighbor) and not _bit_get(visited, neighbor):
+                    came_from[neighbor] = node
+                    _bit_set(visited, neighbor)
+                    if neighbor == goal_idx:
+                        return _trace_nb(came_from, goal_idx)
+                    queue[tail] = neighbor
+                    tail += 1
+
+    return np.empty(0, np.int32), 0
+
+@njit(cache=True)
+def _dfs_nb(blocked, rows, cols, start_idx, goal_idx):
+    """Numba kernel for dfs; the stack is a preallocated array of indices."""
+    n = rows * cols
+    stack = np.empty(n, np.int32)
+    visited = np.zeros((n + 63) >> 6, np.uint64)
+    came_from = np.full(n, -1, np.int32)
+    offsets = (cols, -cols, 1, -1)
+    top = 1
+    stack[0] = start_idx
+    _bit_set(visited, start_idx)
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if node == goal_idx:
+            return _trace_nb(came_from, goal_idx)
+
+        r, c = node // cols, node % cols
+        for k in range(4):
+            dr, dc = _MOVES_REV[k]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
+                if not _bit_get(blocked, neighbor) and not _bit_get(visited, neighbor):
+                    came_from[neighbor] = node
+                    _bit_set(visited, neighbor)
+                    stack[top] = neighbor
+                    top += 1
+
+    return np.empty(0, np.int32), 0
+
+@njit(cache=True)
+def _heap_push_nb(f_heap, node_heap, size, f_score, node):
+    """Array-backed _heap_push; returns the new heap size."""
+    i = size
+    while i > 0:
+        up = (i - 1) >> 1
+        if f_heap[up] <= f_score:
+            break
+        f_heap[i] = f_heap[up]
+        node_heap[i] = node_heap[up]
+        i = up
+    f_heap[i] = f_score
+    node_heap[i] = node
+    return size + 1
+
+@njit(cache=True)
+def _sift_down_nb(f_heap, node_heap, size, f_score, node):
+    """Array-backed _sift_down over the first size entries."""
+    i = 0
+    child = 1
+    while child < size:
+        if child + 1 < size and f_heap[child + 1] < f_heap[child]:
+            child += 1
+        if f_heap[child] >= f_score:
+            break
+        f_heap[i] = f_heap[child]
+        node_heap[i] = node_heap[child]
+        i = child
+        child = 2 * i + 1
+    f_heap[i] = f_score
+    node_heap[i] = node
+
+@njit(cache=True)
+def _heap_pop_nb(f_heap, node_heap, size):
+    """Array-backed _heap_pop; returns (f_score, node, new size)."""
+    f_score, node = f_heap[0], node_heap[0]
+    size -= 1
+    if size:
+        _sift_down_nb(f_heap, node_heap, size, f_heap[size], node_heap[size])
+    return f_score, node, size
+
+@njit(cache=True)
+def _heap_pushpop_nb(f_heap, node_heap, size, f_score, node):
+    """Array-backed _heap_pushpop; the size is unchanged, returns (f_score, node)."""
+    if size == 0 or f_score <= f_heap[0]:
+        return f_score, node
+    top_f, top_node = f_heap[0], node_heap[0]
+    _sift_down_nb(f_heap, node_heap, size, f_score, node)
+    return top_f, top_node
+
+@njit(cache=True)
+def _astar_nb(blocked, rows, cols, start_idx, goal_idx):
+    """Numba kernel for a_star_search; g-scores live in a dense array."""
+    n = rows * cols
+    # Each cell is expanded at most once and pushes at most 4 neighbours.
+    f_heap = np.empty(4 * n + 1, np.int32)
+    node_heap = np.empty(4 * n + 1, np.int32)
+    min_fuel_consumed = np.full(n, _UNREACHED, np.int32)
+    closed = np.zeros(n, np.bool_)
+    came_from = np.full(n, -1, np.int32)
+    offsets = (-1, 1, -cols, cols)
+    goal_r, goal_c = goal_idx // cols, goal_idx % cols
+    size = 0
+    next_node = start_idx
+    min_fuel_consumed[start_idx] = 0
+    if start_idx == goal_idx:
+        return _trace_nb(came_from, goal_idx)
+
+    while next_node >= 0 or size > 0:
+        if next_node >= 0:
+            node, next_node = next_node, -1
+        else:
+            _, node, size = _heap_pop_nb(f_heap, node_heap, size)
+        if closed[node]:
+            continue
+        closed[node] = True
+        r, c = node // cols, node % cols
+        current_fuel = min_fuel_consumed[node]
+        best_f, best_node = _UNREACHED, -1
+
+        for k in range(4):
+            dr, dc = _MOVES[k]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                neighbor = node + offsets[k]
                 tentative_fuel = current_fuel + 1
-                
-                # If we've found a more fuel-efficient path to this neighbor
-                if tentative_fuel < min_fuel_consumed.get(neighbor, float('inf')):
+                if not _bit_get(blocked, neighbor) and tentative_fuel < min_fuel_consumed[neighbor]:
                     min_fuel_consumed[neighbor] = tentative_fuel
-                    
-                    # f_score = fuel_consumed + estimated_remaining_fuel
-                    f_score = tentative_fuel + manhattan_distance(neighbor, goal)
-                    
-                    new_path = path + [neighbor]
-                    heapq.heappush(open_list, (f_score, tentative_fuel, neighbor, new_path))
-    
+                    came_from[neighbor] = node
+                    if neighbor == goal_idx:
+                        return _trace_nb(came_from, goal_idx)
+                    f_score = tentative_fuel + abs(nr - goal_r) + abs(nc - goal_c)
+                    if f_score < best_f:
+                        best_f, best_node, f_score, neighbor = f_score, neighbor, best_f, best_node
+                    if neighbor >= 0:
+                        size = _heap_push_nb(f_heap, node_heap, size, f_score, neighbor)
+
+        if best_node >= 0:
+            _, next_node = _heap_pushpop_nb(f_heap, node_heap, size, best_f, best_node)
+
+    return np.empty(0, np.int32), 0
+
+def _run_kernel(kernel, grid, start, goal):
+    """
+    Packs the grid, runs a Numba search kernel and converts its result.
+    :param kernel: One of _bfs_nb, _dfs_nb or _astar_nb.
+    :return: List of (row, col) coordinates representing the path, or None.
+    """
+    blocked, rows, cols = _pack_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    path, length = kernel(blocked, rows, cols,
+                          start[0] * cols + start[1], goal[0] * cols + goal[1])
+    if length == 0:
+        return None
+    return [divmod(int(node), cols) for node in path]
+
+# =================================================================
+# Compiled (Cython) Search Core
+# =================================================================
+def _run_compiled(search, grid, start, goal):
+    """
+    Runs a search from the compiled _search module on the packed grid.
+    The C code releases the GIL while it searches.
+    :param search: One of _search.bfs, _search.dfs or _search.a_star_search.
+    :return: List of (row, col) coordinates representing the path, or None.
+    """
+    blocked, rows, cols = _pack_grid(grid)
+    if not _on_grid(start, goal, rows, cols):
+        return None
+    path = search(blocked, rows, cols,
+                  start[0] * cols + start[1], goal[0] * cols + goal[1])
+    if path is None:
+        return None
+    return [divmod(node, cols) for node in path]
+
+# =================================================================
+# Grid-Specialised BFS via Runtime Code Generation
+# =================================================================
+# BFS source for one fixed grid. The free-neighbour table is baked in as a
+# literal, so the search loop has no bounds checks and never reads the
+# grid; CPython folds the nested tuple into a single constant.
+_SPECIALIZED_BFS_TEMPLATE = '''\
+def {name}(grid, start, goal):
+    neighbors = {neighbors!r}
+    if not _on_grid(start, goal, {rows}, {cols}):
+        return None
+    start_idx = start[0] * {cols} + start[1]
+    goal_idx = goal[0] * {cols} + goal[1]
+    if start_idx == goal_idx:
+        return [tuple(start)]
+    parent = {{start_idx: None}}
+    queue = [start_idx]
+    for node in queue:
+        for neighbor in neighbors[node]:
+            if neighbor not in parent:
+                parent[neighbor] = node
+                if neighbor == goal_idx:
+                    return _reconstruct_path(parent, goal_idx, {cols})
+                queue.append(neighbor)
     return None
+'''
+
+@lru_cache(maxsize=64)
+def _specialized_bfs(rows, cols, cells):
+    """Generates and compiles the BFS for one flattened grid."""
+    neighbors = []
+    for node in range(rows * cols):
+        r, c = divmod(node, cols)
+        neighbors.append(tuple(
+            (r + dr) * cols + c + dc for dr, dc in _MOVES
+            if 0 <= r + dr < rows and 0 <= c + dc < cols
+            and cells[(r + dr) * cols + c + dc] == 0
+        ))
+    name = f"_bfs_{rows}x{cols}"
+    src = _SPECIALIZED_BFS_TEMPLATE.format(
+        name=name, rows=rows, cols=cols, neighbors=tuple(neighbors))
+    namespace = {"_on_grid": _on_grid, "_reconstruct_path": _reconstruct_path}
+    exec(compile(src, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+def specialize_bfs(grid):
+    """
+    Generates a BFS function specialised for one grid. It is a drop-in
+    replacement for bfs and returns the same paths, but it must only be
+    called with the grid it was generated for.
+    :param grid: 2D list or NumPy array representing the map (0: path, 1: obstacle).
+    :return: Function (grid, start, goal) -> list of coordinates, or None.
+    """
+    cells, rows, cols = _flatten_grid(grid)
+    return _specialized_bfs(rows, cols, cells)
+
+# =================================================================
+# Search Result Cache
+# =================================================================
+@lru_cache(maxsize=64)
+def _search_cached(search, rows, cols, cells, start, goal):
+    """Runs search on the grid rebuilt from its cells and stores the path as a tuple."""
+    grid = np.frombuffer(cells, dtype=np.uint8).reshape(rows, cols)
+    path = search(grid, start, goal)
+    return None if path is None else tuple(path)
+
+def cached_search(search, grid, start, goal):
+    """
+    Runs search(grid, start, goal), reusing the result of an identical
+    earlier query on a grid with the same contents.
+    :param search: A search function such as bfs, dfs or a_star_search.
+    :return: List of coordinates representing the path, or None.
+    """
+    cells, rows, cols = _flatten_grid(grid)
+    path = _search_cached(search, rows, cols, cells, tuple(start), tuple(goal))
+    return None if path is None else list(path)
+
+def clear_search_cache():
+    """Forgets all cached paths."""
+    _search_cached.cache_clear()
 
 # =================================================================
 # Visualization Helper Function
@@ -137,19 +888,18 @@ def visualize_path(grid, path, start, goal, algorithm_name):
         print("❌ No path could be found.")
         return
 
-    display_grid = [list(row) for row in grid]
+    display_grid = np.where(np.asarray(grid) == 1, '#', ' ')
     
     # Mark the path
-    for r, c in path:
-        display_grid[r][c] = '.'
+    path_rows, path_cols = zip(*path)
+    display_grid[np.array(path_rows), np.array(path_cols)] = '.'
     
-    display_grid[start[0]][start[1]] = 'S'
-    display_grid[goal[0]][goal[1]] = 'G'
+    display_grid[start[0], start[1]] = 'S'
+    display_grid[goal[0], goal[1]] = 'G'
     
     print(f"\n--- {algorithm_name} Result ---")
     print("S: Start, G: Goal, #: Obstacle, .: Path")
-    for row in display_grid:
-        print(" ".join(str(cell).replace('1', '#').replace('0', ' ') for cell in row))
+    print("\n".join(" ".join(row) for row in display_grid))
     
     fuel_consumed = len(path) - 1
     print(f"Path Length: {fuel_consumed} steps")
@@ -162,13 +912,16 @@ def main_menu():
     """
     Presents an interactive menu for the user to run pathfinding algorithms.
     """
-    city_grid = [
+    city_grid = np.asarray([
         [0, 0, 0, 0, 1, 0, 0, 0],
         [0, 1, 1, 0, 1, 0, 1, 0],
         [0, 0, 0, 0, 0, 0, 0, 0],
         [1, 1, 0, 1, 1, 1, 0, 0],
         [0, 0, 0, 0, 0, 0, 0, 0]
-    ]
+    ], dtype=np.int8)
+
+    # BFS with this fixed map baked in
+    city_bfs = specialize_bfs(city_grid)
 
     start_point = (0, 0)
     goal_point = (4, 7)
@@ -186,22 +939,22 @@ def main_menu():
         choice = input("Enter your choice (1-5): ")
         
         if choice == '1':
-            a_star_path = a_star_search(city_grid, start_point, goal_point)
+            a_star_path = cached_search(a_star_search, city_grid, start_point, goal_point)
             visualize_path(city_grid, a_star_path, start_point, goal_point, "A* Search (Fuel Optimized)")
         elif choice == '2':
-            bfs_path = bfs(city_grid, start_point, goal_point)
+            bfs_path = cached_search(city_bfs, city_grid, start_point, goal_point)
             visualize_path(city_grid, bfs_path, start_point, goal_point, "Breadth-First Search (BFS)")
         elif choice == '3':
-            dfs_path = dfs(city_grid, start_point, goal_point)
+            dfs_path = cached_search(dfs, city_grid, start_point, goal_point)
             visualize_path(city_grid, dfs_path, start_point, goal_point, "Depth-First Search (DFS)")
         elif choice == '4':
-            a_star_path = a_star_search(city_grid, start_point, goal_point)
+            a_star_path = cached_search(a_star_search, city_grid, start_point, goal_point)
             visualize_path(city_grid, a_star_path, start_point, goal_point, "A* Search (Fuel Optimized)")
             
-            bfs_path = bfs(city_grid, start_point, goal_point)
+            bfs_path = cached_search(city_bfs, city_grid, start_point, goal_point)
             visualize_path(city_grid, bfs_path, start_point, goal_point, "Breadth-First Search (BFS)")
             
-            dfs_path = dfs(city_grid, start_point, goal_point)
+            dfs_path = cached_search(dfs, city_grid, start_point, goal_point)
             visualize_path(city_grid, dfs_path, start_point, goal_point, "Depth-First Search (DFS)")
             
             print("\nComparison Summary:")
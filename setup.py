@@ -0,0 +1,25 @@
+"""
+Builds the optional AOT-compiled search core used by autonom.py.
+
+    python setup.py build_ext --inplace
+
+Without Cython only autonom.py is installed and the Numba or pure-Python
+searches are used instead.
+"""
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("_search", ["_search.pyx"])],
+        compiler_directives={"language_level": 3},
+    )
+
+setup(
+    name="autonomous-delivery-agent",
+    py_modules=["autonom"],
+    ext_modules=ext_modules,
+)
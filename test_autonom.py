@@ -0,0 +1,177 @@
+import random
+import unittest
+from unittest import mock
+
+import autonom
+
+# Search backends as (_CYTHON_AVAILABLE, _NUMBA_AVAILABLE) settings; the
+# pure-Python one is always available
+ENGINES = {"python": (False, False)}
+if autonom._NUMBA_AVAILABLE:
+    ENGINES["numba"] = (False, True)
+if autonom._CYTHON_AVAILABLE:
+    ENGINES["cython"] = (True, False)
+
+
+def _engine(name):
+    """Patches the module so that its searches run on the named backend."""
+    cython, numba = ENGINES[name]
+    return mock.patch.multiple(autonom, _CYTHON_AVAILABLE=cython,
+                               _NUMBA_AVAILABLE=numba)
+
+
+def _random_query(rng):
+    """Builds a random grid with a free start and random start and goal cells."""
+    rows, cols = rng.randint(1, 15), rng.randint(1, 15)
+    density = rng.random() * 0.45
+    grid = [[1 if rng.random() < density else 0 for _ in range(cols)]
+            for _ in range(rows)]
+    start = (rng.randrange(rows), rng.randrange(cols))
+    goal = (rng.randrange(rows), rng.randrange(cols))
+    grid[start[0]][start[1]] = 0
+    return grid, start, goal
+
+
+def _is_valid_path(grid, path, start, goal):
+    """Checks that path runs from start to goal over free, adjacent cells."""
+    if path[0] != start or path[-1] != goal:
+        return False
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        if abs(r1 - r2) + abs(c1 - c2) != 1:
+            return False
+    return all(grid[r][c] == 0 for r, c in path)
+
+
+class BidirectionalAStarTest(unittest.TestCase):
+
+    def test_blocked_goal_has_no_path(self):
+        grid = [[0, 1],
+                [0, 0]]
+        self.assertIsNone(autonom.bidirectional_a_star(grid, (0, 0), (0, 1)))
+        self.assertIsNone(autonom.bfs(grid, (0, 0), (0, 1)))
+
+    def test_matches_bfs_path_length(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            grid, start, goal = _random_query(rng)
+            expected = autonom.bfs(grid, start, goal)
+            path = autonom.bidirectional_a_star(grid, start, goal)
+            if expected is None:
+                self.assertIsNone(path, (grid, start, goal))
+            else:
+                self.assertIsNotNone(path, (grid, start, goal))
+                self.assertEqual(len(path), len(expected), (grid, start, goal))
+                self.assertTrue(_is_valid_path(grid, path, start, goal),
+                                (grid, start, goal, path))
+
+
+
+class EngineParityTest(unittest.TestCase):
+    """The Cython and Numba backends must return the pure-Python paths."""
+
+    SEARCHES = ("bfs", "dfs", "a_star_search")
+
+    def _paths(self, engine, grid, start, goal):
+        with _engine(engine):
+            return [getattr(autonom, name)(grid, start, goal)
+                    for name in self.SEARCHES]
+
+    def _assert_same_paths(self, grid, start, goal):
+        expected = self._paths("python", grid, start, goal)
+        for engine in ENGINES:
+            self.assertEqual(self._paths(engine, grid, start, goal), expected,
+                             (engine, grid, start, goal))
+
+    def test_random_grids(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            self._assert_same_paths(*_random_query(rng))
+
+    def test_start_is_goal(self):
+        self._assert_same_paths([[0, 0], [1, 0]], (1, 1), (1, 1))
+
+    def test_blocked_goal(self):
+        self._assert_same_paths([[0, 1], [0, 0]], (0, 0), (0, 1))
+
+    def test_off_grid_endpoints(self):
+        grid = [[0] * 8 for _ in range(5)]
+        self._assert_same_paths(grid, (0, 0), (0, 8))
+        self._assert_same_paths(grid, (40, 40), (0, 0))
+
+
+class OffGridTest(unittest.TestCase):
+
+    def test_off_grid_endpoints_have_no_path(self):
+        grid = [[0] * 8 for _ in range(5)]
+        searches = (autonom.bfs, autonom.dfs, autonom.a_star_search,
+                    autonom.bidirectional_a_star)
+        # (0, 8) would roll over to (1, 0) if flattened unchecked
+        for start, goal in (((0, 0), (0, 8)), ((0, 0), (-1, 0)),
+                            ((0, 8), (1, 1)), ((40, 40), (0, 0))):
+            for search in searches:
+                self.assertIsNone(search(grid, start, goal),
+                                  (search.__name__, start, goal))
+
+
+class CachedSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        autonom.clear_search_cache()
+
+    def test_repeated_query_is_served_from_cache(self):
+        grid = [[0, 0], [0, 0]]
+        first = autonom.cached_search(autonom.bfs, grid, (0, 0), (1, 1))
+        second = autonom.cached_search(autonom.bfs, grid, [0, 0], [1, 1])
+        self.assertEqual(first, second)
+        self.assertEqual(autonom._search_cached.cache_info().hits, 1)
+
+    def test_mutated_grid_is_searched_again(self):
+        grid = [[0, 0, 0],
+                [1, 1, 0],
+                [0, 0, 0]]
+        path = autonom.cached_search(autonom.bfs, grid, (0, 0), (2, 0))
+        self.assertEqual(len(path), 7)
+
+        # Block a cell on the only route in place
+        grid[1][2] = 1
+        self.assertIsNone(autonom.cached_search(autonom.bfs, grid, (0, 0), (2, 0)))
+        grid[1][0] = 0
+        self.assertEqual(autonom.cached_search(autonom.bfs, grid, (0, 0), (2, 0)),
+                         [(0, 0), (1, 0), (2, 0)])
+
+
+class SpecializeBfsTest(unittest.TestCase):
+
+    def test_matches_pure_python_bfs(self):
+        rng = random.Random(2)
+        for _ in range(300):
+            grid, start, goal = _random_query(rng)
+            with _engine("python"):
+                expected = autonom.bfs(grid, start, goal)
+            self.assertEqual(autonom.specialize_bfs(grid)(grid, start, goal),
+                             expected, (grid, start, goal))
+
+    def test_off_grid_endpoints_have_no_path(self):
+        grid = [[0] * 8 for _ in range(5)]
+        city_bfs = autonom.specialize_bfs(grid)
+        self.assertIsNone(city_bfs(grid, (0, 0), (0, 8)))
+        self.assertIsNone(city_bfs(grid, (40, 40), (0, 0)))
+
+    def test_generated_functions_are_bounded(self):
+        autonom._specialized_bfs.cache_clear()
+        for n in range(1, 100):
+            autonom.specialize_bfs([[0] * n])
+        self.assertEqual(autonom._specialized_bfs.cache_info().currsize, 64)
+
+
+class VisualizePathTest(unittest.TestCase):
+
+    def test_list_endpoints_mark_single_cells(self):
+        grid = [[0, 0], [0, 0]]
+        with mock.patch("builtins.print") as fake_print:
+            autonom.visualize_path(grid, [(0, 0), (0, 1)], [0, 0], [0, 1], "Test")
+        rendered = [call.args[0] for call in fake_print.call_args_list]
+        self.assertIn("S G\n   ", rendered)
+
+if __name__ == "__main__":
+    unittest.main()